@@ -12,6 +12,9 @@ dotenv.config();
 // Initialize Express app
 const app = express();
 const PORT = process.env.PORT || 4001;
+// Read once at startup; config changes require a restart anyway
+const NODE_ENV = process.env.NODE_ENV;
+const ENVIRONMENT = NODE_ENV || 'development';
 
 // Middleware
 app.use(helmet());
@@ -32,7 +35,7 @@ app.get('/health', (req: Request, res: Response) => {
     status: 'ok',
     timestamp: new Date().toISOString(),
     service: 'publo-backend',
-    environment: process.env.NODE_ENV || 'development',
+    environment: ENVIRONMENT,
   });
 });
 
@@ -74,14 +77,14 @@ app.use((err: Error, req: Request, res: Response, next: NextFunction) => {
   console.error('Error:', err);
   res.status(500).json({
     error: 'Internal Server Error',
-    message: process.env.NODE_ENV === 'development' ? err.message : undefined,
+    message: NODE_ENV === 'development' ? err.message : undefined,
   });
 });
 
 // Start server
 app.listen(PORT, () => {
   console.log(`🚀 Backend server running on port ${PORT}`);
-  console.log(`📊 Environment: ${process.env.NODE_ENV || 'development'}`);
+  console.log(`📊 Environment: ${ENVIRONMENT}`);
   console.log(`🗄️  Database URL: ${process.env.DATABASE_URL ? 'configured' : 'not configured'}`);
 });
 
@@ -11,6 +11,9 @@ import { getProviderAdapter, detectProviderFromModel } from '@/lib/providers'
 import { decryptAPIKey } from '@/lib/security/encryption'
 import { LLMProvider } from '@/types/api-keys'
 
+// Shared encoder for streamed answer chunks (stateless, safe to reuse)
+const encoder = new TextEncoder()
+
 export async function POST(request: NextRequest) {
   console.log('[API /content/answer] ===== REQUEST START =====')
   try {
@@ -275,7 +278,7 @@ Please answer this question based on the available context. Be helpful and speci
             // Extract text from the object based on chunk type
             if (chunk.type === 'content' && chunk.content) {
               // Emit plain text (not object)
-              controller.enqueue(new TextEncoder().encode(chunk.content))
+              controller.enqueue(encoder.encode(chunk.content))
             } else if (chunk.type === 'done') {
               // Stream complete
               controller.close()
@@ -205,12 +205,25 @@ export async function GET(request: NextRequest) {
       )
     }
 
-    // Get embedding count (handle case where table doesn't exist)
-    const { count: embeddingCount, error: countError } = await supabase
-      .from('document_embeddings')
-      .select('*', { count: 'exact', head: true })
-      .eq('story_structure_node_id', nodeId)
-      .eq('embedding_status', 'completed')
+    // Embedding count and queue status are independent - fetch both at once
+    // (handle case where tables don't exist)
+    const [
+      { count: embeddingCount, error: countError },
+      { data: queueData, error: queueError },
+    ] = await Promise.all([
+      supabase
+        .from('document_embeddings')
+        .select('*', { count: 'exact', head: true })
+        .eq('story_structure_node_id', nodeId)
+        .eq('embedding_status', 'completed'),
+      // Don't use .single() as it throws error if no rows
+      supabase
+        .from('embedding_queue')
+        .select('status, created_at, processed_at')
+        .eq('story_structure_node_id', nodeId)
+        .order('created_at', { ascending: false })
+        .limit(1),
+    ])
 
     // If table doesn't exist or other error, return unavailable status
     if (countError) {
@@ -226,14 +239,6 @@ export async function GET(request: NextRequest) {
       return response
     }
 
-    // Get queue status (don't use .single() as it throws error if no rows)
-    const { data: queueData, error: queueError } = await supabase
-      .from('embedding_queue')
-      .select('status, created_at, processed_at')
-      .eq('story_structure_node_id', nodeId)
-      .order('created_at', { ascending: false })
-      .limit(1)
-
     // Ignore queue errors (queue table might not exist yet)
     if (queueError) {
       console.warn('Embedding queue table not available:', queueError.message)
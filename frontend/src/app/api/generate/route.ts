@@ -12,6 +12,13 @@ import { getProviderAdapter, detectProviderFromModel } from '@/lib/providers'
 import { decryptAPIKey } from '@/lib/security/encryption'
 import type { GenerateRequest, GenerateResponse, LLMProvider } from '@/types/api-keys'
 
+// SSE framing shared by every streamed event (encoder is stateless, safe to reuse)
+const encoder = new TextEncoder()
+
+function encodeSSE(payload: unknown): Uint8Array {
+  return encoder.encode(`data: ${JSON.stringify(payload)}\n\n`)
+}
+
 export async function POST(request: Request) {
   try {
     // Parse request body first (before auth, so we can check for key_id)
@@ -216,8 +223,6 @@ export async function POST(request: Request) {
     if (stream) {
       console.log(`🌊 Streaming generation with ${provider} model ${model}`)
       
-      const encoder = new TextEncoder()
-      
       const readable = new ReadableStream({
         async start(controller) {
           try {
@@ -240,11 +245,11 @@ export async function POST(request: Request) {
               })
               
               // Send as single chunk
-              controller.enqueue(encoder.encode(`data: ${JSON.stringify({
+              controller.enqueue(encodeSSE({
                 type: 'content',
                 content: result.content,
                 done: true
-              })}\n\n`))
+              }))
               
               controller.close()
               return
@@ -263,16 +268,16 @@ export async function POST(request: Request) {
               tool_choice,
               use_function_calling
             })) {
-              controller.enqueue(encoder.encode(`data: ${JSON.stringify(chunk)}\n\n`))
+              controller.enqueue(encodeSSE(chunk))
             }
             
             controller.close()
           } catch (error: any) {
             console.error('❌ Streaming error:', error)
-            controller.enqueue(encoder.encode(`data: ${JSON.stringify({
+            controller.enqueue(encodeSSE({
               type: 'error',
               error: error.message || 'Streaming failed'
-            })}\n\n`))
+            }))
             controller.close()
           }
         }
@@ -343,6 +348,8 @@ export async function POST(request: Request) {
     console.log(`✅ Generation complete. Tokens: ${generationResult.usage.total_tokens}, Cost: $${cost.total_cost.toFixed(4)}`)
 
     // Track usage in database (use key owner's ID for tracking)
+    // Awaited on purpose: on serverless targets (Vercel) work still pending
+    // after the response is sent can be frozen or dropped, losing usage rows
     const { error: usageError } = await supabase
       .from('ai_usage_history')
       .insert({
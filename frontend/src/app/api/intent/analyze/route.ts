@@ -11,6 +11,19 @@ import { getProviderAdapter, detectProviderFromModel } from '@/lib/providers'
 import { decryptAPIKey } from '@/lib/security/encryption'
 import { LLMProvider } from '@/types/api-keys'
 
+// Original GPT-4 snapshots predate response_format and reject it
+// (skips a guaranteed 400; any other model is caught by isJsonModeRejection)
+const JSON_MODE_UNSUPPORTED_MODELS = /^gpt-4(-32k)?(-0314|-0613)?$/
+
+/**
+ * The provider refused the request because of JSON mode itself
+ * (e.g. "'response_format' of type 'json_object' is not supported with this model")
+ */
+function isJsonModeRejection(error: any): boolean {
+  const message = error?.message || ''
+  return error?.statusCode === 400 && /response_format|json_object/i.test(message)
+}
+
 export async function POST(request: NextRequest) {
   try {
     const supabase = await createClient()
@@ -36,14 +49,15 @@ export async function POST(request: NextRequest) {
       )
     }
     
-    const { system_prompt, user_prompt, conversation_history, temperature = 0.3 } = body
+    // json_mode: caller expects a bare JSON object back (not every caller
+    // does - e.g. clarification option matching returns a plain ID)
+    const { system_prompt, user_prompt, temperature = 0.3, json_mode = false } = body
     
     console.log('[API /intent/analyze] Request params:', {
       hasSystemPrompt: !!system_prompt,
       systemPromptLength: system_prompt?.length || 0,
       hasUserPrompt: !!user_prompt,
       userPromptLength: user_prompt?.length || 0,
-      hasConversationHistory: !!conversation_history,
       temperature
     })
     
@@ -126,12 +140,31 @@ export async function POST(request: NextRequest) {
       generateOptions.temperature = temperature
     }
     
+    // Provider-native JSON mode: the reply is guaranteed to be a bare object,
+    // so it parses without fence stripping (OpenAI only; other adapters ignore it)
+    if (json_mode && provider === 'openai' && !isReasoningModel &&
+        !JSON_MODE_UNSUPPORTED_MODELS.test(orchestratorModelId)) {
+      generateOptions.response_format = { type: 'json_object' }
+    }
+    
     // Generate intent analysis using orchestrator with intelligent fallback
     let result
     let attemptedModel = orchestratorModelId
     
     try {
-      result = await adapter.generate(apiKey, generateOptions)
+      try {
+        result = await adapter.generate(apiKey, generateOptions)
+      } catch (jsonModeError: any) {
+        if (!generateOptions.response_format || !isJsonModeRejection(jsonModeError)) {
+          throw jsonModeError
+        }
+        
+        // Model doesn't support JSON mode - retry once as plain text
+        // (callers still parse fenced/wrapped JSON replies)
+        console.warn(`[API /intent/analyze] ⚠️ ${attemptedModel} rejected JSON mode, retrying without it`)
+        delete generateOptions.response_format
+        result = await adapter.generate(apiKey, generateOptions)
+      }
       console.log(`[API /intent/analyze] ✅ Success with ${attemptedModel}, length: ${result.content.length}`)
     } catch (primaryError: any) {
       console.warn(`[API /intent/analyze] ⚠️ Primary model (${attemptedModel}) failed:`, primaryError.message)
@@ -333,10 +333,11 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
     
-    // Get last sync
+    // Get last sync (only the fields the sync button renders - sync_results
+    // holds every provider's full model list and is never read here)
     const { data: lastSync, error: syncError } = await supabase
       .from('model_sync_history')
-      .select('*')
+      .select('synced_at, total_new_models')
       .eq('user_id', user.id)
       .order('synced_at', { ascending: false })
       .limit(1)
@@ -522,23 +522,26 @@ export default function OrchestratorPanel({
     edges: canvasEdges.length
   })
   
-  // Debug logging
-  console.log('🔍 [Canvas Context Debug]', {
-    canvasNodesCount: canvasNodes.length,
-    canvasEdgesCount: canvasEdges.length,
-    connectedNodesFound: canvasContext.connectedNodes.length,
-    externalContentMapKeys: Object.keys(externalContentMap),
-    canvasNodes: canvasNodes.map(n => ({ 
-      id: n.id, 
-      type: n.type, 
-      label: n.data?.label, 
-      hasContentMap: !!n.data?.contentMap,
-      hasDocumentData: !!n.data?.document_data,  // ✅ DEBUG
-      documentDataKeys: n.data?.document_data ? Object.keys(n.data.document_data) : []  // ✅ DEBUG
-    })),
-    canvasEdges: canvasEdges.map(e => ({ source: e.source, target: e.target })),
-    orchestratorId: 'context'
-  })
+  // Debug logging (runs on every render and maps every canvas node, so
+  // keep it out of production builds like the WorldState log above)
+  if (process.env.NODE_ENV === 'development') {
+    console.log('🔍 [Canvas Context Debug]', {
+      canvasNodesCount: canvasNodes.length,
+      canvasEdgesCount: canvasEdges.length,
+      connectedNodesFound: canvasContext.connectedNodes.length,
+      externalContentMapKeys: Object.keys(externalContentMap),
+      canvasNodes: canvasNodes.map(n => ({ 
+        id: n.id, 
+        type: n.type, 
+        label: n.data?.label, 
+        hasContentMap: !!n.data?.contentMap,
+        hasDocumentData: !!n.data?.document_data,  // ✅ DEBUG
+        documentDataKeys: n.data?.document_data ? Object.keys(n.data.document_data) : []  // ✅ DEBUG
+      })),
+      canvasEdges: canvasEdges.map(e => ({ source: e.source, target: e.target })),
+      orchestratorId: 'context'
+    })
+  }
   
   // Handle confirmation timeout and auto-clear
   useEffect(() => {
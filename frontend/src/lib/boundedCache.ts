@@ -0,0 +1,71 @@
+/**
+ * Bounded in-memory cache
+ *
+ * Map-backed LRU with an optional TTL. Maps iterate in insertion order, so
+ * re-inserting on every read and write keeps the least recently used entry
+ * first, and that is the one evicted once the cache is over capacity.
+ * Expired entries are dropped when they are read.
+ */
+
+interface CacheEntry<V> {
+  value: V
+  expiresAt: number
+}
+
+export class BoundedCache<K, V> {
+  private entries = new Map<K, CacheEntry<V>>()
+
+  /**
+   * @param maxEntries - Entries kept before the least recently used is evicted
+   * @param ttlMs - Optional lifetime of an entry after it was set
+   */
+  constructor(
+    private maxEntries: number,
+    private ttlMs?: number
+  ) {}
+
+  /**
+   * Get a live entry, marking it as most recently used
+   */
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key)
+    if (!entry) {
+      return undefined
+    }
+
+    this.entries.delete(key)
+    if (entry.expiresAt <= Date.now()) {
+      return undefined
+    }
+
+    // Refresh recency
+    this.entries.set(key, entry)
+    return entry.value
+  }
+
+  /**
+   * Store an entry as most recently used, evicting the oldest if over capacity
+   */
+  set(key: K, value: V): void {
+    const expiresAt = this.ttlMs !== undefined ? Date.now() + this.ttlMs : Infinity
+
+    this.entries.delete(key)
+    this.entries.set(key, { value, expiresAt })
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value
+      if (oldest === undefined) {
+        break
+      }
+      this.entries.delete(oldest)
+    }
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key)
+  }
+
+  get size(): number {
+    return this.entries.size
+  }
+}
@@ -37,15 +37,35 @@ const DEFAULT_CONFIG: EmbeddingConfig = {
 }
 
 /**
- * Generate embedding for a single text using OpenAI API
+ * Decrypted OpenAI keys, scoped to the Supabase client that fetched them.
+ * Routes create one client per request, so a pipeline run that embeds many
+ * sections/batches looks the key up and decrypts it once instead of per call,
+ * and nothing outlives the request
  */
-export async function generateEmbedding(
-  supabase: SupabaseClient,
-  userId: string,
-  text: string,
-  config: EmbeddingConfig = DEFAULT_CONFIG
-): Promise<EmbeddingResult> {
-  // Get user's OpenAI API key
+const apiKeyCache = new WeakMap<SupabaseClient, Map<string, Promise<string>>>()
+
+/**
+ * Get the user's decrypted OpenAI API key (server-side only)
+ */
+async function getOpenAIApiKey(supabase: SupabaseClient, userId: string): Promise<string> {
+  let keysForClient = apiKeyCache.get(supabase)
+  if (!keysForClient) {
+    keysForClient = new Map()
+    apiKeyCache.set(supabase, keysForClient)
+  }
+
+  let pending = keysForClient.get(userId)
+  if (!pending) {
+    pending = fetchOpenAIApiKey(supabase, userId)
+    keysForClient.set(userId, pending)
+    // Don't keep failures around - let the next call retry
+    pending.catch(() => keysForClient!.delete(userId))
+  }
+
+  return pending
+}
+
+async function fetchOpenAIApiKey(supabase: SupabaseClient, userId: string): Promise<string> {
   const { data: apiKeyData, error: apiKeyError } = await supabase
     .from('user_api_keys')
     .select('encrypted_key, is_active, validation_status')
@@ -69,6 +89,20 @@ export async function generateEmbedding(
     throw new Error(`Failed to decrypt API key: ${decryptError instanceof Error ? decryptError.message : 'Unknown error'}`)
   }
 
+  return openaiApiKey
+}
+
+/**
+ * Generate embedding for a single text using OpenAI API
+ */
+export async function generateEmbedding(
+  supabase: SupabaseClient,
+  userId: string,
+  text: string,
+  config: EmbeddingConfig = DEFAULT_CONFIG
+): Promise<EmbeddingResult> {
+  const openaiApiKey = await getOpenAIApiKey(supabase, userId)
+
   // Prepare request
   const requestBody: {
     input: string
@@ -124,29 +158,7 @@ export async function generateBatchEmbeddings(
     throw new Error('Batch size too large. Maximum 2048 texts per batch.')
   }
   
-  // Get user's OpenAI API key
-  const { data: apiKeyData, error: apiKeyError } = await supabase
-    .from('user_api_keys')
-    .select('encrypted_key, is_active, validation_status')
-    .eq('provider', 'openai')
-    .eq('user_id', userId)
-    .eq('is_active', true)
-    .eq('validation_status', 'valid')
-    .single()
-  
-  if (apiKeyError || !apiKeyData) {
-    throw new Error('OpenAI API key not found. Please configure your API key in Settings.')
-  }
-
-  // Decrypt the API key (only works server-side)
-  let openaiApiKey: string
-  try {
-    // Dynamic import to avoid bundling crypto in client
-    const { decryptAPIKey } = await import('@/lib/security/encryption')
-    openaiApiKey = decryptAPIKey(apiKeyData.encrypted_key)
-  } catch (decryptError) {
-    throw new Error(`Failed to decrypt API key: ${decryptError instanceof Error ? decryptError.message : 'Unknown error'}`)
-  }
+  const openaiApiKey = await getOpenAIApiKey(supabase, userId)
 
   // Prepare request
   const requestBody: {
@@ -85,7 +85,6 @@ export class WriteContentAction extends BaseAction {
     // ============================================================
     
     if (request.structureItems && request.structureItems.length > 0) {
-      const lowerMessage = request.message.toLowerCase()
       let messageTargetSectionId: string | null = null
       
       // Helper: Normalize text for fuzzy matching
@@ -99,24 +98,29 @@ export class WriteContentAction extends BaseAction {
           .trim()
       
       // Helper: Find section by name (fuzzy match)
+      // The search term is normalized once, not on every recursion level
       const findSectionByName = (items: any[], searchTerm: string): any => {
         const normalizedSearch = normalizeText(searchTerm)
         
-        for (const item of items) {
-          const normalizedName = normalizeText(item.name || '')
-          
-          if (normalizedName === normalizedSearch ||
-              normalizedName.includes(normalizedSearch) ||
-              normalizedSearch.includes(normalizedName)) {
-            return item
-          }
-          
-          if (item.children) {
-            const found = findSectionByName(item.children, searchTerm)
-            if (found) return found
+        const findByName = (list: any[]): any => {
+          for (const item of list) {
+            const normalizedName = normalizeText(item.name || '')
+            
+            if (normalizedName === normalizedSearch ||
+                normalizedName.includes(normalizedSearch) ||
+                normalizedSearch.includes(normalizedName)) {
+              return item
+            }
+            
+            if (item.children) {
+              const found = findByName(item.children)
+              if (found) return found
+            }
           }
+          return null
         }
-        return null
+        
+        return findByName(items)
       }
       
       // ============================================================
@@ -6,7 +6,9 @@
  * Provides constructive feedback for the Writer Agent to improve.
  */
 
+import { createHash } from 'crypto'
 import type { Agent, AgentTask, AgentContext, AgentResult, CritiquePayload } from './types'
+import { BoundedCache } from '@/lib/boundedCache'
 
 interface CritiqueResult {
   approved: boolean
@@ -21,6 +23,62 @@ interface CritiqueResult {
     consistency: { score: number; notes: string }
     formatting: { score: number; notes: string }
   }
+  // Set only by createFallbackCritique (unparseable response)
+  isFallback?: boolean
+}
+
+// ============================================================
+// CRITIQUE CACHE
+// ============================================================
+
+/**
+ * Critiques keyed by a hash of the exact review request.
+ * The writer-critic loop regularly re-submits identical content (unchanged
+ * revisions, converging competitive drafts); a hit skips the LLM round-trip.
+ * Shared across CriticAgent instances, bounded as an LRU.
+ */
+const CRITIQUE_CACHE_MAX_ENTRIES = 100
+const critiqueCache = new BoundedCache<string, CritiqueResult>(CRITIQUE_CACHE_MAX_ENTRIES)
+
+/**
+ * Copy a cached critique so callers can't mutate the cached entry
+ */
+function copyCritique(critique: CritiqueResult): CritiqueResult {
+  const { craft, pacing, dialogue, consistency, formatting } = critique.detailedFeedback
+  return {
+    ...critique,
+    issues: [...critique.issues],
+    suggestions: [...critique.suggestions],
+    strengths: [...critique.strengths],
+    detailedFeedback: {
+      craft: { ...craft },
+      pacing: { ...pacing },
+      dialogue: { ...dialogue },
+      consistency: { ...consistency },
+      formatting: { ...formatting }
+    }
+  }
+}
+
+// ============================================================
+// RESPONSE PATTERNS
+// ============================================================
+
+const CODE_FENCE_PATTERN = /```(?:json)?\s*([\s\S]*?)```/
+const JSON_OBJECT_PATTERN = /\{[\s\S]*\}/
+const PROSE_LINE_PATTERNS: RegExp[] = [
+  /^\*\*.*?\*\*\s*/gm, // Remove **headers**
+  /^#+\s+.*$/gm, // Remove markdown headers
+  /^Here.*?:\s*/gim, // Remove "Here is the..." prose
+  /^Based on.*?:\s*/gim // Remove "Based on..." prose
+]
+
+function tryParseJSON(text: string): any | null {
+  try {
+    return JSON.parse(text)
+  } catch {
+    return null
+  }
 }
 
 export class CriticAgent implements Agent {
@@ -110,18 +168,41 @@ export class CriticAgent implements Agent {
 
 RESPOND WITH ONLY THE JSON OBJECT ABOVE. NO OTHER TEXT.`
       
+      const requestBody = JSON.stringify({
+        segmentId: 'critic-review', // Identifier for review task
+        prompt: combinedPrompt,
+        storyStructureNodeId: context.metadata?.storyStructureNodeId || null,
+        structureItems: context.dependencies?.structure || [],
+        contentMap: context.dependencies?.contentMap || {},
+        format: context.metadata?.format || 'novel'
+        // /api/content/generate will auto-select model and handle streaming
+      })
+      
+      // Identical review request → reuse the previous critique
+      const cacheKey = createHash('sha256').update(requestBody).digest('hex')
+      const cached = critiqueCache.get(cacheKey)
+      if (cached) {
+        const executionTime = Date.now() - startTime
+        console.log(`🎭 [CriticAgent ${this.id}] Cache hit (score: ${cached.score}/10)`)
+        
+        this.status = 'idle'
+        
+        return {
+          data: copyCritique(cached),
+          tokensUsed: 0,
+          executionTime,
+          metadata: {
+            model: 'cached',
+            approved: cached.approved,
+            score: cached.score
+          }
+        }
+      }
+      
       const response = await fetch('/api/content/generate', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          segmentId: 'critic-review', // Identifier for review task
-          prompt: combinedPrompt,
-          storyStructureNodeId: context.metadata?.storyStructureNodeId || null,
-          structureItems: context.dependencies?.structure || [],
-          contentMap: context.dependencies?.contentMap || {},
-          format: context.metadata?.format || 'novel'
-          // /api/content/generate will auto-select model and handle streaming
-        })
+        body: requestBody
       })
       
       if (!response.ok) {
@@ -134,6 +215,11 @@ RESPOND WITH ONLY THE JSON OBJECT ABOVE. NO OTHER TEXT.`
       const critique = this.parseCritique(data.content)
       const executionTime = Date.now() - startTime
       
+      // Don't cache fallback critiques - a retry may parse cleanly
+      if (!critique.isFallback) {
+        critiqueCache.set(cacheKey, copyCritique(critique))
+      }
+      
       // Log review summary
       const approved = critique.approved ? '✅ APPROVED' : '⚠️ NEEDS REVISION'
       console.log(`🎭 [CriticAgent ${this.id}] ${approved} (score: ${critique.score}/10) in ${executionTime}ms`)
@@ -339,48 +425,54 @@ Evaluate the content honestly and provide feedback that will elevate the writing
         console.log('🎭 [CriticAgent] Raw response (first 300 chars):', jsonContent.substring(0, 300))
         
         // Strategy 1: Remove markdown code blocks (```json ... ``` or ``` ... ```)
-        const codeBlockMatch = jsonContent.match(/```(?:json)?\s*([\s\S]*?)```/)
+        const codeBlockMatch = jsonContent.match(CODE_FENCE_PATTERN)
         if (codeBlockMatch) {
           jsonContent = codeBlockMatch[1].trim()
           console.log('✅ [CriticAgent] Extracted from code block')
         }
         
-        // Strategy 2: Remove markdown formatting and prose
-        jsonContent = jsonContent.replace(/^\*\*.*?\*\*\s*/gm, '') // Remove **headers**
-        jsonContent = jsonContent.replace(/^#+\s+.*$/gm, '') // Remove markdown headers
-        jsonContent = jsonContent.replace(/^Here.*?:\s*/gim, '') // Remove "Here is the..." prose
-        jsonContent = jsonContent.replace(/^Based on.*?:\s*/gim, '') // Remove "Based on..." prose
+        // Fast path: fenced or bare JSON (the usual reply) parses as-is,
+        // so the prose-stripping passes below only run on messy responses
+        critique = jsonContent.startsWith('{') ? tryParseJSON(jsonContent) : null
         
-        // Strategy 3: Find JSON object (greedy match for nested objects)
-        const jsonMatch = jsonContent.match(/\{[\s\S]*\}/)
-        if (jsonMatch) {
-          jsonContent = jsonMatch[0]
-        }
-        
-        // Strategy 4: If still no valid JSON, try to find any object-like structure
-        if (!jsonContent.includes('{')) {
-          console.warn('⚠️ [CriticAgent] No JSON object found in response')
-          console.log('Full response:', responseContent)
-          return this.createFallbackCritique()
-        }
-        
-        try {
-          critique = JSON.parse(jsonContent)
+        if (critique) {
           console.log('✅ [CriticAgent] Successfully parsed JSON critique')
-        } catch (parseError) {
-          console.warn('⚠️ [CriticAgent] JSON parse failed, attempting manual extraction')
-          console.log('Failed content:', jsonContent.substring(0, 500))
+        } else {
+          // Strategy 2: Remove markdown formatting and prose
+          for (const pattern of PROSE_LINE_PATTERNS) {
+            jsonContent = jsonContent.replace(pattern, '')
+          }
           
-          // Strategy 5: Last resort - try to extract key fields manually using regex
-          const scoreMatch = jsonContent.match(/"score"\s*:\s*(\d+\.?\d*)/i)
-          const approvedMatch = jsonContent.match(/"approved"\s*:\s*(true|false)/i)
+          // Strategy 3: Find JSON object (greedy match for nested objects)
+          const jsonMatch = jsonContent.match(JSON_OBJECT_PATTERN)
+          if (jsonMatch) {
+            jsonContent = jsonMatch[0]
+          }
           
-          if (scoreMatch) {
-            console.log('📊 [CriticAgent] Manual extraction: score =', scoreMatch[1])
-            return this.createFallbackCritique(parseFloat(scoreMatch[1]))
+          // Strategy 4: If still no valid JSON, try to find any object-like structure
+          if (!jsonContent.includes('{')) {
+            console.warn('⚠️ [CriticAgent] No JSON object found in response')
+            console.log('Full response:', responseContent)
+            return this.createFallbackCritique()
           }
           
-          return this.createFallbackCritique()
+          try {
+            critique = JSON.parse(jsonContent)
+            console.log('✅ [CriticAgent] Successfully parsed JSON critique')
+          } catch (parseError) {
+            console.warn('⚠️ [CriticAgent] JSON parse failed, attempting manual extraction')
+            console.log('Failed content:', jsonContent.substring(0, 500))
+            
+            // Strategy 5: Last resort - try to extract key fields manually using regex
+            const scoreMatch = jsonContent.match(/"score"\s*:\s*(\d+\.?\d*)/i)
+            
+            if (scoreMatch) {
+              console.log('📊 [CriticAgent] Manual extraction: score =', scoreMatch[1])
+              return this.createFallbackCritique(parseFloat(scoreMatch[1]))
+            }
+            
+            return this.createFallbackCritique()
+          }
         }
       } else {
         return this.createFallbackCritique()
@@ -432,7 +524,8 @@ Evaluate the content honestly and provide feedback that will elevate the writing
         dialogue: { score: fallbackScore, notes: 'Review incomplete' },
         consistency: { score: fallbackScore, notes: 'Review incomplete' },
         formatting: { score: fallbackScore, notes: 'Review incomplete' }
-      }
+      },
+      isFallback: true
     }
   }
 }
@@ -23,6 +23,26 @@ import { CriticAgent } from './CriticAgent'
 import { WriterCriticCluster } from './clusters/WriterCriticCluster'
 import type { AgentTask, ExecutionStrategy, DAGNode } from './types'
 import { saveAgentContent, batchSaveAgentContent } from './utils/contentPersistence'
+import { BoundedCache } from '@/lib/boundedCache'
+
+/**
+ * Max write_content calls in flight during cluster execution
+ * (keeps concurrent writer-critic loops within provider rate limits)
+ */
+const CLUSTER_MAX_CONCURRENCY = 4
+
+/**
+ * Strategy decisions are reused for identical action sets within this window
+ * (re-running the same sections shouldn't cost another LLM round-trip).
+ * Module-level because getMultiAgentOrchestrator builds a fresh instance
+ * per message
+ */
+const STRATEGY_CACHE_MAX_ENTRIES = 50
+const STRATEGY_CACHE_TTL_MS = 10 * 60 * 1000
+const strategyCache = new BoundedCache<string, { strategy: ExecutionStrategy; reasoning: string }>(
+  STRATEGY_CACHE_MAX_ENTRIES,
+  STRATEGY_CACHE_TTL_MS
+)
 
 export class MultiAgentOrchestrator extends OrchestratorEngine {
   private agentRegistry: AgentRegistry
@@ -64,15 +84,17 @@ export class MultiAgentOrchestrator extends OrchestratorEngine {
     const response = await super.orchestrate(request)
     
     // 🔍 DEBUG: Log what actions were generated
-    console.log('🔍 [MultiAgentOrchestrator] Actions generated:', {
-      count: response.actions?.length || 0,
-      actions: response.actions?.map((a: any) => ({
-        type: a.type,
-        sectionId: a.payload?.sectionId,
-        sectionName: a.payload?.sectionName,
-        autoStart: a.payload?.autoStart
-      }))
-    })
+    if (process.env.NODE_ENV === 'development') {
+      console.log('🔍 [MultiAgentOrchestrator] Actions generated:', {
+        count: response.actions?.length || 0,
+        actions: response.actions?.map((a: any) => ({
+          type: a.type,
+          sectionId: a.payload?.sectionId,
+          sectionName: a.payload?.sectionName,
+          autoStart: a.payload?.autoStart
+        }))
+      })
+    }
     
     // Step 2: CRITICAL - Filter actions BEFORE execution
     // Determine which actions should be executed by agents vs. returned to UI
@@ -105,7 +127,7 @@ export class MultiAgentOrchestrator extends OrchestratorEngine {
     })
     
     // Step 3: Get the blackboard message count BEFORE agent execution
-    const messagesBefore = this.getAgentBlackboard().getRecentMessages(1000).length
+    const messagesBefore = this.getAgentBlackboard().getMessageCount()
     
     // Step 4: Execute ONLY the filtered actions with agents
     if (actionsForAgentExecution.length > 0) {
@@ -138,8 +160,7 @@ export class MultiAgentOrchestrator extends OrchestratorEngine {
     }
     
     // Step 5: Extract NEW messages for UI display (messages added during agent execution)
-    const messagesAfter = this.getAgentBlackboard().getRecentMessages(1000)
-    const newMessages = messagesAfter.slice(messagesBefore)
+    const newMessages = this.getAgentBlackboard().getMessagesSince(messagesBefore)
     
     // Step 6: Add new messages to thinkingSteps for UI display
     if (newMessages.length > 0) {
@@ -218,6 +239,15 @@ export class MultiAgentOrchestrator extends OrchestratorEngine {
     
     const contentActions = actions.filter(a => a.type === 'generate_content')
     
+    // Same action set as a recent decision → reuse it. Keyed on the actions
+    // only: recent activity is context for the LLM, not a decision input
+    const cacheKey = JSON.stringify(actionSummary)
+    const cached = strategyCache.get(cacheKey)
+    if (cached) {
+      console.log(`⚡ [Strategy Selection] Cache hit: ${cached.strategy}`)
+      return { ...cached }
+    }
+    
     // Get recent blackboard messages for context
     const recentMessages = blackboard.getRecentMessages(5)
     const context = recentMessages.map(m => `${m.role}: ${m.content}`).join('\n')
@@ -309,10 +339,15 @@ Respond in JSON format:
         throw new Error(`Invalid strategy: ${analysis.strategy} (normalized: ${normalizedStrategy})`)
       }
       
-      return {
+      const result = {
         strategy: normalizedStrategy as ExecutionStrategy,
         reasoning: analysis.reasoning
       }
+      
+      // Only successful decisions are cached - failures fall back to sequential
+      strategyCache.set(cacheKey, result)
+      
+      return { ...result }
     } catch (error) {
       console.error('❌ [Strategy Selection] Error:', error)
       
@@ -740,74 +775,92 @@ Respond in JSON format:
       type: 'progress'
     })
     
-    // Execute each generate_content action via write_content tool
-    for (const action of actions) {
-      if (action.type === 'generate_content') {
-        try {
-          console.log(`🔧 [MultiAgentOrchestrator] Calling write_content tool for: ${action.payload?.sectionName}`)
-          
-          // ✅ FIX: Pass storyStructureNodeId and format from request
-          const storyStructureNodeId = request?.currentStoryStructureNodeId || 
-                                       (this as any).worldState?.getState().canvas.activeDocumentNodeId
-          const format = request?.documentFormat || 'novel'
-          
-          console.log(`🔧 [executeCluster] Adding node context to write_content:`, {
-            nodeId: storyStructureNodeId,
-            format: format
-          })
-          
-          // Execute via tool system (Tools → Agents → API)
-          const toolResult = await toolRegistry.execute(
-            'write_content',
-            {
-              sectionId: action.payload?.sectionId,
-              sectionName: action.payload?.sectionName,
-              prompt: action.payload?.prompt,
-              useCluster: false, // ⚠️ DISABLED: See PHASE3_COMPLETE.md "Known Limitations"
-              storyStructureNodeId, // ✅ Pass node ID
-              format // ✅ Pass document format
-            },
-            {
-              worldState: this.worldState, // ✅ Guaranteed defined by check above
-              userId: this.getConfig().userId,
-              userKeyId: request?.userKeyId,
-              blackboard: this.getAgentBlackboard(),
-              supabaseClient: request?.supabaseClient // ✅ FIX: Pass authenticated Supabase client
-            }
-          )
-          
-          if (toolResult.success) {
-            console.log(`✅ [MultiAgentOrchestrator] Tool execution successful`)
-            
-            // Tool result already includes quality metrics
-            const metadata = toolResult.metadata || {}
-            this.getAgentBlackboard().addMessage({
-              role: 'orchestrator',
-              content: `✨ Generated ${metadata.wordCount || 0} words (quality: ${metadata.finalScore || 0}/10, ${metadata.iterations || 1} iteration${metadata.iterations > 1 ? 's' : ''})`,
-              type: 'result'
-            })
-          } else {
-            console.error(`❌ [MultiAgentOrchestrator] Tool execution failed:`, toolResult.error)
-            
-            this.getAgentBlackboard().addMessage({
-              role: 'orchestrator',
-              content: `❌ Failed to generate content: ${toolResult.error}`,
-              type: 'error'
-            })
-          }
-        } catch (error) {
-          console.error(`❌ [MultiAgentOrchestrator] Tool execution error:`, error)
-          
-          this.getAgentBlackboard().addMessage({
-            role: 'orchestrator',
-            content: `❌ Tool execution failed: ${error instanceof Error ? error.message : 'Unknown error'}`,
-            type: 'error'
-          })
+    // Cluster runs target 1-2 high-priority sections. Their writer-critic
+    // loops don't depend on each other, so generation runs concurrently in
+    // bounded batches; the saves all hit the same node's document_data and
+    // are serialized per node by saveAgentContent
+    const contentActions = actions.filter(a => a.type === 'generate_content')
+    
+    actions
+      .filter(a => a.type !== 'generate_content')
+      .forEach(a => console.log(`⏭️ [MultiAgentOrchestrator] Skipping non-content action: ${a.type}`))
+    
+    for (let i = 0; i < contentActions.length; i += CLUSTER_MAX_CONCURRENCY) {
+      const batch = contentActions.slice(i, i + CLUSTER_MAX_CONCURRENCY)
+      await Promise.all(batch.map(action => this.executeClusterAction(action, toolRegistry, request)))
+    }
+  }
+  
+  /**
+   * Execute a single generate_content action via the write_content tool
+   * Errors are reported to the Blackboard rather than thrown, so one failed
+   * section doesn't abort the rest of its batch
+   */
+  private async executeClusterAction(
+    action: OrchestratorAction,
+    toolRegistry: any,
+    request?: any
+  ): Promise<void> {
+    try {
+      console.log(`🔧 [MultiAgentOrchestrator] Calling write_content tool for: ${action.payload?.sectionName}`)
+      
+      // ✅ FIX: Pass storyStructureNodeId and format from request
+      const storyStructureNodeId = request?.currentStoryStructureNodeId || 
+                                   this.worldState?.getActiveDocument().nodeId
+      const format = request?.documentFormat || 'novel'
+      
+      console.log(`🔧 [executeCluster] Adding node context to write_content:`, {
+        nodeId: storyStructureNodeId,
+        format: format
+      })
+      
+      // Execute via tool system (Tools → Agents → API)
+      const toolResult = await toolRegistry.execute(
+        'write_content',
+        {
+          sectionId: action.payload?.sectionId,
+          sectionName: action.payload?.sectionName,
+          prompt: action.payload?.prompt,
+          useCluster: false, // ⚠️ DISABLED: See PHASE3_COMPLETE.md "Known Limitations"
+          storyStructureNodeId, // ✅ Pass node ID
+          format // ✅ Pass document format
+        },
+        {
+          worldState: this.worldState, // ✅ Guaranteed defined by check above
+          userId: this.getConfig().userId,
+          userKeyId: request?.userKeyId,
+          blackboard: this.getAgentBlackboard(),
+          supabaseClient: request?.supabaseClient // ✅ FIX: Pass authenticated Supabase client
         }
+      )
+      
+      if (toolResult.success) {
+        console.log(`✅ [MultiAgentOrchestrator] Tool execution successful`)
+        
+        // Tool result already includes quality metrics
+        const metadata = toolResult.metadata || {}
+        this.getAgentBlackboard().addMessage({
+          role: 'orchestrator',
+          content: `✨ Generated ${metadata.wordCount || 0} words (quality: ${metadata.finalScore || 0}/10, ${metadata.iterations || 1} iteration${metadata.iterations > 1 ? 's' : ''})`,
+          type: 'result'
+        })
       } else {
-        // For non-content actions, log that we're skipping
-        console.log(`⏭️ [MultiAgentOrchestrator] Skipping non-content action: ${action.type}`)
+        console.error(`❌ [MultiAgentOrchestrator] Tool execution failed:`, toolResult.error)
+        
+        this.getAgentBlackboard().addMessage({
+          role: 'orchestrator',
+          content: `❌ Failed to generate content: ${toolResult.error}`,
+          type: 'error'
+        })
       }
+    } catch (error) {
+      console.error(`❌ [MultiAgentOrchestrator] Tool execution error:`, error)
+      
+      this.getAgentBlackboard().addMessage({
+        role: 'orchestrator',
+        content: `❌ Tool execution failed: ${error instanceof Error ? error.message : 'Unknown error'}`,
+        type: 'error'
+      })
     }
   }
   
@@ -7,6 +7,7 @@
  */
 
 import type { Agent, AgentTask, AgentContext, AgentResult, TaskPayload } from './types'
+import { countWords } from './utils/wordCount'
 
 export class WriterAgent implements Agent {
   id: string
@@ -101,7 +102,7 @@ export class WriterAgent implements Agent {
         metadata: {
           model: 'auto-selected', // /api/content/generate auto-selects model
           cost: 0, // Not tracked by /api/content/generate yet
-          wordCount: this.countWords(data.content)
+          wordCount: countWords(data.content)
         }
       }
     } catch (error) {
@@ -341,13 +342,5 @@ export class WriterAgent implements Agent {
     // Add buffer for formatting and variation
     return Math.ceil(targetWords / 0.75 * 1.2)
   }
-  
-  // ============================================================
-  // UTILITIES
-  // ============================================================
-  
-  private countWords(text: string): number {
-    return text.trim().split(/\s+/).length
-  }
 }
 
@@ -10,6 +10,7 @@
 import type { AgentTask, AgentContext } from '../types'
 import type { WriterAgent } from '../WriterAgent'
 import type { CriticAgent } from '../CriticAgent'
+import { countWords } from '../utils/wordCount'
 
 interface ClusterResult {
   content: string
@@ -96,13 +97,13 @@ export class WriterCriticCluster {
       content = writeResult.data
       totalTokens += writeResult.tokensUsed
       
-      console.log(`✅ [WriterCriticCluster] Initial draft: ${this.countWords(content)} words (${writeResult.tokensUsed} tokens)`)
+      console.log(`✅ [WriterCriticCluster] Initial draft: ${countWords(content)} words (${writeResult.tokensUsed} tokens)`)
       
       // ✅ NEW: Post progress to Blackboard
       if (context.blackboard) {
         context.blackboard.addMessage({
           role: 'orchestrator',
-          content: `🎭 Reviewing "${sectionName}" (${this.countWords(content)} words)...`,
+          content: `🎭 Reviewing "${sectionName}" (${countWords(content)} words)...`,
           type: 'progress'
         })
       }
@@ -185,6 +186,7 @@ export class WriterCriticCluster {
         console.log(`🔄 [WriterCriticCluster] Iteration ${iteration}: Revision based on critique`)
         
         const previousCritique = history[history.length - 1].critique
+        const previousContent = content
         
         // Writer revises based on critique
         const writerStart = Date.now()
@@ -197,7 +199,7 @@ export class WriterCriticCluster {
                 ...task.payload.context,
                 iteration,
                 previousCritique,
-                previousContent: content // Include for reference
+                previousContent // Include for reference
               }
             }
           },
@@ -208,30 +210,37 @@ export class WriterCriticCluster {
         content = revisionResult.data
         totalTokens += revisionResult.tokensUsed
         
-        console.log(`✍️ [WriterCriticCluster] Revision ${iteration}: ${this.countWords(content)} words (${revisionResult.tokensUsed} tokens)`)
+        console.log(`✍️ [WriterCriticCluster] Revision ${iteration}: ${countWords(content)} words (${revisionResult.tokensUsed} tokens)`)
         
-        // Review revision
-        const criticStart = Date.now()
-        const critiqueResult = await this.critic.execute(
-          {
-            ...task,
-            type: 'review_content',
-            payload: {
-              ...task.payload,
-              context: {
-                ...task.payload.context,
-                content,
-                iteration,
-                previousCritique // Critic can see previous feedback
-              }
-            }
-          },
-          context
-        )
-        criticTime += Date.now() - criticStart
+        // Review revision (skipped when the writer returned the same text -
+        // the critic would be judging identical content, so keep its verdict)
+        let critique = previousCritique
         
-        const critique = critiqueResult.data
-        totalTokens += critiqueResult.tokensUsed
+        if (content === previousContent) {
+          console.log(`♻️ [WriterCriticCluster] Revision ${iteration} unchanged, reusing previous critique`)
+        } else {
+          const criticStart = Date.now()
+          const critiqueResult = await this.critic.execute(
+            {
+              ...task,
+              type: 'review_content',
+              payload: {
+                ...task.payload,
+                context: {
+                  ...task.payload.context,
+                  content,
+                  iteration,
+                  previousCritique // Critic can see previous feedback
+                }
+              }
+            },
+            context
+          )
+          criticTime += Date.now() - criticStart
+          
+          critique = critiqueResult.data
+          totalTokens += critiqueResult.tokensUsed
+        }
         finalScore = critique.score
         
         const action = critique.approved ? 'approved' : 'revision'
@@ -399,10 +408,6 @@ export class WriterCriticCluster {
   // UTILITIES
   // ============================================================
   
-  private countWords(text: string): number {
-    return text.trim().split(/\s+/).length
-  }
-  
   /**
    * Get summary of cluster performance
    */
@@ -413,7 +418,7 @@ export class WriterCriticCluster {
 - Approved: ${result.approved ? 'Yes' : 'No (max iterations reached)'}
 - Total Time: ${result.metadata.totalTime}ms
 - Total Tokens: ${result.metadata.totalTokens}
-- Word Count: ${this.countWords(result.content)}`
+- Word Count: ${countWords(result.content)}`
   }
 }
 
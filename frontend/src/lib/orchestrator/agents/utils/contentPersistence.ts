@@ -8,6 +8,7 @@
 import { createClient } from '@/lib/supabase/client'
 import { DocumentManager } from '@/lib/document/DocumentManager'
 import type { SupabaseClient } from '@supabase/supabase-js'
+import { countWords } from './wordCount'
 
 export interface SaveContentOptions {
   storyStructureNodeId: string
@@ -23,12 +24,48 @@ export interface SaveContentResult {
   wordCount?: number
 }
 
+// ============================================================
+// PER-NODE SAVE QUEUE
+// ============================================================
+
+/**
+ * /api/agent/save-content reads the node's whole document_data, updates one
+ * section and writes the whole blob back, with no lock or version check.
+ * Two saves to the same node in flight at once would lose one section, so
+ * saves are chained per node ID: generation can run concurrently, but each
+ * node's read-modify-write happens one at a time (within this client).
+ */
+const saveQueueByNode = new Map<string, Promise<void>>()
+
+function enqueueNodeSave<T>(nodeId: string, save: () => Promise<T>): Promise<T> {
+  const previous = saveQueueByNode.get(nodeId) || Promise.resolve()
+  
+  // Run after the previous save settles, whether or not it succeeded
+  const result = previous.then(save, save)
+  const tail = result.then(() => undefined, () => undefined)
+  saveQueueByNode.set(nodeId, tail)
+  
+  // Drop the entry once this was the last queued save for the node
+  tail.then(() => {
+    if (saveQueueByNode.get(nodeId) === tail) {
+      saveQueueByNode.delete(nodeId)
+    }
+  })
+  
+  return result
+}
+
 /**
  * Save agent-generated content to Supabase
  * 
  * This replicates the logic from handleWriteContent in canvas/page.tsx
+ * Saves to the same node are serialized (see PER-NODE SAVE QUEUE)
  */
 export async function saveAgentContent(options: SaveContentOptions): Promise<SaveContentResult> {
+  return enqueueNodeSave(options.storyStructureNodeId, () => postAgentContent(options))
+}
+
+async function postAgentContent(options: SaveContentOptions): Promise<SaveContentResult> {
   const { storyStructureNodeId, sectionId, content, userId, supabaseClient } = options
   
   // 🔍 DEBUG: Log save attempt
@@ -229,7 +266,7 @@ async function saveAgentContentDirect_DEPRECATED(options: SaveContentOptions): P
       return { success: false, error: updateError.message }
     }
     
-    const wordCount = content.trim().split(/\s+/).length
+    const wordCount = countWords(content)
     
     console.log('✅ [saveAgentContent] Content saved successfully:', {
       sectionId,
@@ -0,0 +1,49 @@
+/**
+ * Word counting for agent output
+ *
+ * Generated sections can run to several thousand words and are counted
+ * repeatedly (progress messages, logs, metadata). `text.trim().split(/\s+/)`
+ * allocates one string per word just to read `.length`, so this walks the
+ * string once and counts whitespace→word transitions instead.
+ */
+
+/**
+ * Matches the code points covered by the regex `\s` class
+ */
+function isWhitespace(code: number): boolean {
+  return (
+    code === 32 ||
+    (code >= 9 && code <= 13) ||
+    code === 160 ||
+    code === 0x1680 ||
+    (code >= 0x2000 && code <= 0x200a) ||
+    code === 0x2028 ||
+    code === 0x2029 ||
+    code === 0x202f ||
+    code === 0x205f ||
+    code === 0x3000 ||
+    code === 0xfeff
+  )
+}
+
+/**
+ * Count whitespace-separated words without allocating substrings
+ *
+ * @param text - Content to count
+ * @returns Number of words (0 for empty or whitespace-only text)
+ */
+export function countWords(text: string): number {
+  let count = 0
+  let inWord = false
+
+  for (let i = 0; i < text.length; i++) {
+    if (isWhitespace(text.charCodeAt(i))) {
+      inWord = false
+    } else if (!inWord) {
+      inWord = true
+      count++
+    }
+  }
+
+  return count
+}
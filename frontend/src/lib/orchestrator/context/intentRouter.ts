@@ -55,6 +55,145 @@ export interface IntentContext {
   canvasContext?: string // CANVAS VISIBILITY: Formatted canvas context for LLM
 }
 
+// ============================================================
+// PATTERN TABLES
+// Built once at module load instead of on every analyzeIntent() call
+// ============================================================
+
+/**
+ * Fold a pattern list into one case-insensitive alternation, so each
+ * category check is a single regex test instead of one per pattern
+ * (only used with .test(), so capture groups don't matter)
+ */
+function combinePatterns(patterns: RegExp[]): RegExp {
+  return new RegExp(patterns.map(pattern => `(?:${pattern.source})`).join('|'), 'i')
+}
+
+const NAVIGATION_PATTERN = combinePatterns([
+  // Generic navigation
+  /^(go to|jump to|navigate to|show me|open|scroll to|take me to)\s+(the\s+)?(chapter|section|scene|act|part|sequence|beat)/i,
+  /^(go to|jump to|navigate to|show me)\s+(chapter|section|scene|act|part|beat)\s+\d+/i,
+
+  // Screenplay-specific (scenes and beats)
+  /^(scene|beat)\s+\d+/i,
+  /^(open|show|go to)\s+(scene|beat)/i,
+
+  // Short forms like "scene 1" or "beat 2"
+  /^(chapter|section|scene|act|part|sequence|beat)\s+\d+/i,
+])
+
+const WRITE_PATTERN = combinePatterns([
+  /^write/i,
+  /^expand/i,
+  /^continue/i,
+  /^add (more|content)/i,
+  /^fill in/i,
+  /^develop/i,
+  /more (content|writing|text)/i,
+  /^extend/i,
+  /^flesh out/i,
+])
+
+const COHERENCE_PATTERN = combinePatterns([
+  /keep (it |the story |everything )?coherent/i,
+  /maintain consistency/i,
+  /(update|fix|adjust|revise) (earlier|previous|other|related) (sections?|parts?|chapters?)/i,
+  /and (also )?(update|change|fix|adjust|rewrite) (earlier|previous|related)/i,
+  /make sure (it |everything )?makes sense/i,
+  /(rewrite|change).*(and|then) (update|fix|adjust)/i,
+  /fix (any )?continuity/i,
+  /keep (the )?story consistent/i,
+  // Multi-section generation patterns
+  /(write|generate|create|fill).*(all|every|multiple).*(scenes?|chapters?|sections?)/i,
+  /(write|generate|create|fill).*(scene|chapter|section).*(after|following).*(scene|chapter|section)/i,
+  /start with.*and (write|continue|finish).*(rest|all|others)/i,
+])
+
+const IMPROVE_PATTERN = combinePatterns([
+  /^improve/i,
+  /^refine/i,
+  /^polish/i,
+  /^edit/i,
+  /^revise/i,
+  /^enhance/i,
+  /make (it )?better/i,
+  /more (vivid|descriptive|engaging)/i,
+])
+
+const IMPERATIVE_PATTERN = combinePatterns([
+  /^(make|create|add|generate|produce)/i,
+  /^(insert|include|put)/i,
+])
+
+const DELETE_PATTERN = combinePatterns([
+  /^(remove|delete|get rid of|discard|trash|eliminate).*(the |this |that )?(novel|screenplay|report|podcast|story|node)/i,
+  /(remove|delete).*(node|document|story)/i,
+  /^(remove|delete)/i,
+])
+
+const QUESTION_PATTERN = combinePatterns([
+  /^what/i,
+  /^why/i,
+  /^how/i,
+  /^when/i,
+  /^who/i,
+  /^where/i,
+  /^explain/i,
+  /^describe/i,
+  /^tell me (about|why|how|what)/i,
+  /^can you (tell|explain|describe)/i,
+  /^help me (figure out|understand|with)/i,
+  /what (is|are|does|was|were)/i,
+  /what.*all about/i,
+  /\?$/,
+])
+
+const WRITE_IN_NODE_PATTERN = combinePatterns([
+  // "Open" commands - CRITICAL for "open the novel", "let's open the screenplay"
+  /^(open|show|display|view).*(the|that|this|my) (novel|screenplay|report|podcast|document|node)/i,
+  /^let'?s (open|work on|edit).*(the|that|this|my) (novel|screenplay|report|podcast|document)/i,
+
+  // Direct "write in" phrases
+  /(craft|write|fill|expand|develop).*(in |to )(that|the|this|my) (node|document|podcast|screenplay|novel|report)/i,
+  /(add|put|insert|write|get).*(content|text|words).*(in |to |for )(that|the|this|my)/i,
+  /(work on|edit|improve).*(that|the|this|my) (node|document|podcast|screenplay|novel|report)/i,
+  /help (me )?(craft|write|fill|expand).*(node|document|podcast|screenplay|novel|report)/i,
+
+  // "Get/add content to/for my X" - CRITICAL for "get some content to my podcast"
+  /(get|add|create|generate).*(content|text|words).*(to|for|in) (my|the|that|this) (podcast|screenplay|novel|report|document)/i,
+  /help (me )?(get|add|create).*(my|the|that) (podcast|screenplay|novel|report|document)/i,
+
+  // "Help me with X" when X is an existing node
+  /help (me )?with (the|my|that|this) (podcast|screenplay|novel|report|document)/i,
+])
+
+const STRUCTURE_PATTERN = combinePatterns([
+  /create (a |an )?story/i,
+  /create (a |an )?(novel|screenplay|article|report|podcast|interview)/i,
+  /generate (a )?structure/i,
+  /plan (a )?story/i,
+  /outline/i,
+  /^i want to (write|create)/i,
+  /make (a |an )?interview/i,
+  /interview (the )?characters/i,
+  /base(d)? (this|it) on/i,
+  /using (the |our )?screenplay/i,
+  /adapt (the |our )?(screenplay|story|novel)/i,
+])
+
+const CREATE_IN_DOC_PATTERN = combinePatterns([
+  /create (a |an )?(scene|chapter|section)/i,
+  /^write (a |an )?(scene|chapter|paragraph)/i,
+])
+
+const MODIFY_STRUCTURE_PATTERN = combinePatterns([
+  /add (a |an )?(chapter|section|act|scene)/i,
+  /remove (this |the )?(chapter|section|act|scene)/i,
+  /rename/i,
+  /reorder/i,
+  /move (this |the )?section/i,
+])
+
 /**
  * Analyzes user message and determines intent
  * HYBRID: Pattern matching for obvious cases, LLM for complex cases
@@ -101,20 +240,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   
   // PRIORITY 0: Navigation within open document (CRITICAL: must come before other intents)
   if (context.isDocumentViewOpen) {
-    const navigationPatterns = [
-      // Generic navigation
-      /^(go to|jump to|navigate to|show me|open|scroll to|take me to)\s+(the\s+)?(chapter|section|scene|act|part|sequence|beat)/i,
-      /^(go to|jump to|navigate to|show me)\s+(chapter|section|scene|act|part|beat)\s+\d+/i,
-      
-      // Screenplay-specific (scenes and beats)
-      /^(scene|beat)\s+\d+/i,
-      /^(open|show|go to)\s+(scene|beat)/i,
-      
-      // Short forms like "scene 1" or "beat 2"
-      /^(chapter|section|scene|act|part|sequence|beat)\s+\d+/i,
-    ]
-    
-    if (navigationPatterns.some(pattern => pattern.test(message))) {
+    if (NAVIGATION_PATTERN.test(message)) {
       return {
         intent: 'navigate_section',
         confidence: 0.95,
@@ -129,19 +255,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   // PRIORITY 1: Content writing/expansion (when segment is selected)
   if (hasActiveSegment) {
     // Strong write indicators
-    const writePatterns = [
-      /^write/i,
-      /^expand/i,
-      /^continue/i,
-      /^add (more|content)/i,
-      /^fill in/i,
-      /^develop/i,
-      /more (content|writing|text)/i,
-      /^extend/i,
-      /^flesh out/i,
-    ]
-    
-    if (writePatterns.some(pattern => pattern.test(message))) {
+    if (WRITE_PATTERN.test(message)) {
       return {
         intent: 'write_content',
         confidence: 0.95,
@@ -153,22 +267,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
     }
     
     // Coherence-aware rewriting and Multi-section generation
-    const coherencePatterns = [
-      /keep (it |the story |everything )?coherent/i,
-      /maintain consistency/i,
-      /(update|fix|adjust|revise) (earlier|previous|other|related) (sections?|parts?|chapters?)/i,
-      /and (also )?(update|change|fix|adjust|rewrite) (earlier|previous|related)/i,
-      /make sure (it |everything )?makes sense/i,
-      /(rewrite|change).*(and|then) (update|fix|adjust)/i,
-      /fix (any )?continuity/i,
-      /keep (the )?story consistent/i,
-      // Multi-section generation patterns
-      /(write|generate|create|fill).*(all|every|multiple).*(scenes?|chapters?|sections?)/i,
-      /(write|generate|create|fill).*(scene|chapter|section).*(after|following).*(scene|chapter|section)/i,
-      /start with.*and (write|continue|finish).*(rest|all|others)/i,
-    ]
-    
-    if (coherencePatterns.some(pattern => pattern.test(message))) {
+    if (COHERENCE_PATTERN.test(message)) {
       return {
         intent: 'rewrite_with_coherence',
         confidence: 0.95,
@@ -180,18 +279,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
     }
     
     // Improvement indicators (single-section only)
-    const improvePatterns = [
-      /^improve/i,
-      /^refine/i,
-      /^polish/i,
-      /^edit/i,
-      /^revise/i,
-      /^enhance/i,
-      /make (it )?better/i,
-      /more (vivid|descriptive|engaging)/i,
-    ]
-    
-    if (improvePatterns.some(pattern => pattern.test(message))) {
+    if (IMPROVE_PATTERN.test(message)) {
       return {
         intent: 'improve_content',
         confidence: 0.9,
@@ -204,14 +292,9 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
     
     // Ambiguous - user might be asking to write OR having a conversation
     // Only default to writing if it sounds imperative (commands, not questions)
-    const imperativePatterns = [
-      /^(make|create|add|generate|produce)/i,
-      /^(insert|include|put)/i,
-    ]
-    
     if (lowerMessage.length < 50 && 
         !lowerMessage.includes('?') &&
-        imperativePatterns.some(pattern => pattern.test(message))) {
+        IMPERATIVE_PATTERN.test(message)) {
       return {
         intent: 'write_content',
         confidence: 0.6,
@@ -237,13 +320,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   }
   
   // PRIORITY 2: Delete/Remove Node (canvas operations)
-  const deletePatterns = [
-    /^(remove|delete|get rid of|discard|trash|eliminate).*(the |this |that )?(novel|screenplay|report|podcast|story|node)/i,
-    /(remove|delete).*(node|document|story)/i,
-    /^(remove|delete)/i,
-  ]
-  
-  if (deletePatterns.some(pattern => pattern.test(message))) {
+  if (DELETE_PATTERN.test(message)) {
     return {
       intent: 'delete_node',
       confidence: 0.9,
@@ -256,24 +333,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   
   // PRIORITY 3: Questions and Explanations (regardless of context)
   // These should NEVER trigger content generation, only conversation
-  const questionPatterns = [
-    /^what/i,
-    /^why/i,
-    /^how/i,
-    /^when/i,
-    /^who/i,
-    /^where/i,
-    /^explain/i,
-    /^describe/i,
-    /^tell me (about|why|how|what)/i,
-    /^can you (tell|explain|describe)/i,
-    /^help me (figure out|understand|with)/i,
-    /what (is|are|does|was|were)/i,
-    /what.*all about/i,
-    /\?$/,
-  ]
-  
-  if (questionPatterns.some(pattern => pattern.test(message))) {
+  if (QUESTION_PATTERN.test(message)) {
     return {
       intent: 'answer_question',
       confidence: 0.9,
@@ -287,26 +347,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   // PRIORITY 3: Write in existing node (user references a canvas node)
   // HELPFUL MODE: Auto-open the document when user wants to write in a node
   if (!context.isDocumentViewOpen && !hasActiveSegment && context.canvasContext) {
-    const writeInNodePatterns = [
-      // "Open" commands - CRITICAL for "open the novel", "let's open the screenplay"
-      /^(open|show|display|view).*(the|that|this|my) (novel|screenplay|report|podcast|document|node)/i,
-      /^let'?s (open|work on|edit).*(the|that|this|my) (novel|screenplay|report|podcast|document)/i,
-      
-      // Direct "write in" phrases
-      /(craft|write|fill|expand|develop).*(in |to )(that|the|this|my) (node|document|podcast|screenplay|novel|report)/i,
-      /(add|put|insert|write|get).*(content|text|words).*(in |to |for )(that|the|this|my)/i,
-      /(work on|edit|improve).*(that|the|this|my) (node|document|podcast|screenplay|novel|report)/i,
-      /help (me )?(craft|write|fill|expand).*(node|document|podcast|screenplay|novel|report)/i,
-      
-      // "Get/add content to/for my X" - CRITICAL for "get some content to my podcast"
-      /(get|add|create|generate).*(content|text|words).*(to|for|in) (my|the|that|this) (podcast|screenplay|novel|report|document)/i,
-      /help (me )?(get|add|create).*(my|the|that) (podcast|screenplay|novel|report|document)/i,
-      
-      // "Help me with X" when X is an existing node
-      /help (me )?with (the|my|that|this) (podcast|screenplay|novel|report|document)/i,
-    ]
-    
-    if (writeInNodePatterns.some(pattern => pattern.test(message))) {
+    if (WRITE_IN_NODE_PATTERN.test(message)) {
       return {
         intent: 'open_and_write',
         confidence: 0.95,
@@ -320,21 +361,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   
   // PRIORITY 4: Structure creation (ONLY when document panel is CLOSED)
   if (!context.isDocumentViewOpen && !hasActiveSegment) {
-    const structurePatterns = [
-      /create (a |an )?story/i,
-      /create (a |an )?(novel|screenplay|article|report|podcast|interview)/i,
-      /generate (a )?structure/i,
-      /plan (a )?story/i,
-      /outline/i,
-      /^i want to (write|create)/i,
-      /make (a |an )?interview/i,
-      /interview (the )?characters/i,
-      /base(d)? (this|it) on/i,
-      /using (the |our )?screenplay/i,
-      /adapt (the |our )?(screenplay|story|novel)/i,
-    ]
-    
-    if (structurePatterns.some(pattern => pattern.test(message))) {
+    if (STRUCTURE_PATTERN.test(message)) {
       return {
         intent: 'create_structure',
         confidence: 0.9,
@@ -348,12 +375,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   
   // If document panel is OPEN and user says "create", they probably mean "write content"
   if (context.isDocumentViewOpen && hasActiveSegment) {
-    const createInDocPatterns = [
-      /create (a |an )?(scene|chapter|section)/i,
-      /^write (a |an )?(scene|chapter|paragraph)/i,
-    ]
-    
-    if (createInDocPatterns.some(pattern => pattern.test(message))) {
+    if (CREATE_IN_DOC_PATTERN.test(message)) {
       return {
         intent: 'write_content',
         confidence: 0.85,
@@ -366,15 +388,7 @@ export async function analyzeIntent(context: IntentContext): Promise<IntentAnaly
   }
   
   // PRIORITY 5: Structure modification
-  const modifyStructurePatterns = [
-    /add (a |an )?(chapter|section|act|scene)/i,
-    /remove (this |the )?(chapter|section|act|scene)/i,
-    /rename/i,
-    /reorder/i,
-    /move (this |the )?section/i,
-  ]
-  
-  if (modifyStructurePatterns.some(pattern => pattern.test(message))) {
+  if (MODIFY_STRUCTURE_PATTERN.test(message)) {
     return {
       intent: 'modify_structure',
       confidence: 0.85,
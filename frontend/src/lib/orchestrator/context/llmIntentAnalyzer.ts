@@ -11,6 +11,7 @@
 
 import type { IntentAnalysis, UserIntent } from './intentRouter'
 import { buildFormatDescriptionsForLLM } from '../schemas/documentHierarchy'
+import { BoundedCache } from '@/lib/boundedCache'
 
 export interface ConversationMessage {
   role: 'user' | 'assistant'
@@ -289,6 +290,32 @@ HELPFUL AND COLLABORATIVE:
 
 Be smart, conversational, educational, and helpful. When in doubt, ask politely and explain why!`
 
+// ============================================================
+// INTENT CACHE
+// ============================================================
+
+/**
+ * Analyses keyed by the exact user prompt sent to the LLM.
+ * The prompt already embeds the message, canvas/document context and recent
+ * conversation, so a hit means the model would see identical input
+ * (double-submits, retries, repeated "continue"). Bounded LRU with a TTL so
+ * stale reads can't outlive a short editing session.
+ */
+const INTENT_CACHE_MAX_ENTRIES = 200
+const INTENT_CACHE_TTL_MS = 5 * 60 * 1000
+const intentCache = new BoundedCache<string, LLMIntentResult>(INTENT_CACHE_MAX_ENTRIES, INTENT_CACHE_TTL_MS)
+
+// Requests still waiting on the LLM, keyed the same way
+const inflightIntents = new Map<string, Promise<LLMIntentResult>>()
+
+// ============================================================
+// RESPONSE PATTERNS
+// ============================================================
+
+// Leading ```json / ``` fence and trailing ``` fence
+const CODE_FENCE_EDGES_PATTERN = /^```(?:json)?\s*|\s*```$/g
+const JSON_OBJECT_PATTERN = /\{[\s\S]*\}/
+
 /**
  * Analyze intent using LLM reasoning
  */
@@ -307,19 +334,50 @@ Analyze this message and determine the user's intent. Consider the conversation
 
 Return ONLY valid JSON with your analysis. Do not include markdown formatting. Just the raw JSON object.`
 
+  const cached = intentCache.get(analysisPrompt)
+  if (cached) {
+    console.log('[LLM Intent] Cache hit:', { intent: cached.intent, confidence: cached.confidence })
+    return { ...cached }
+  }
+
+  // Same prompt already being analysed (double-submit, retry while the
+  // first request is pending) → share that request instead of sending another
+  let pending = inflightIntents.get(analysisPrompt)
+  if (!pending) {
+    pending = requestLLMIntent(analysisPrompt, context.currentMessage)
+    inflightIntents.set(analysisPrompt, pending)
+    pending.finally(() => inflightIntents.delete(analysisPrompt))
+  } else {
+    console.log('[LLM Intent] Joining in-flight analysis')
+  }
+  
+  return { ...(await pending) }
+}
+
+/**
+ * Send the analysis prompt to the LLM and parse its reply
+ * Never rejects - errors resolve to the conservative fallback intent
+ */
+async function requestLLMIntent(
+  analysisPrompt: string,
+  currentMessage: string
+): Promise<LLMIntentResult> {
   try {
     const requestBody = {
       system_prompt: INTENT_ANALYSIS_SYSTEM_PROMPT,
       user_prompt: analysisPrompt,
-      conversation_history: context.conversationHistory.slice(-5), // Last 5 messages
-      temperature: 0.1 // Lower temp for consistent JSON
+      // Recent conversation is already summarised in the user prompt
+      // (buildContextString), so the raw history is not sent separately
+      temperature: 0.1, // Lower temp for consistent JSON
+      json_mode: true
     }
     
-    console.log('[LLM Intent] Sending request to /api/intent/analyze:', {
-      systemPromptLength: requestBody.system_prompt.length,
-      userPromptLength: requestBody.user_prompt.length,
-      conversationHistoryLength: requestBody.conversation_history.length
-    })
+    if (process.env.NODE_ENV === 'development') {
+      console.log('[LLM Intent] Sending request to /api/intent/analyze:', {
+        systemPromptLength: requestBody.system_prompt.length,
+        userPromptLength: requestBody.user_prompt.length
+      })
+    }
     
     // Call the orchestrator via our API
     const response = await fetch('/api/intent/analyze', {
@@ -346,33 +404,39 @@ Return ONLY valid JSON with your analysis. Do not include markdown formatting. J
       let content = data.content.trim()
       
       // Remove markdown code blocks if present
-      content = content.replace(/^```json\s*/, '').replace(/^```\s*/, '').replace(/\s*```$/, '')
+      content = content.replace(CODE_FENCE_EDGES_PATTERN, '')
       
-      // Extract JSON object if wrapped in text
-      const jsonMatch = content.match(/\{[\s\S]*\}/)
-      if (jsonMatch) {
-        content = jsonMatch[0]
+      // Extract JSON object if wrapped in text (bare JSON - the usual reply -
+      // already spans first '{' to last '}', so skip the copy)
+      if (!(content.startsWith('{') && content.endsWith('}'))) {
+        const jsonMatch = content.match(JSON_OBJECT_PATTERN)
+        if (jsonMatch) {
+          content = jsonMatch[0]
+        }
       }
       
       analysis = JSON.parse(content)
     } catch (parseError) {
       console.error('[LLM Intent] Failed to parse JSON:', data.content)
       // Fallback to conservative intent
-      return createFallbackIntent(context.currentMessage)
+      return createFallbackIntent(currentMessage)
     }
 
-    console.log('[LLM Intent] Analysis:', {
-      intent: analysis.intent,
-      confidence: analysis.confidence,
-      reasoning: analysis.reasoning,
-      needsClarification: analysis.needsClarification
-    })
+    if (process.env.NODE_ENV === 'development') {
+      console.log('[LLM Intent] Analysis:', {
+        intent: analysis.intent,
+        confidence: analysis.confidence,
+        reasoning: analysis.reasoning,
+        needsClarification: analysis.needsClarification
+      })
+    }
 
+    intentCache.set(analysisPrompt, analysis)
     return analysis
 
   } catch (error) {
     console.error('[LLM Intent] Error:', error)
-    return createFallbackIntent(context.currentMessage)
+    return createFallbackIntent(currentMessage)
   }
 }
 
@@ -150,6 +150,10 @@ export interface PatternMemory {
 // BLACKBOARD CLASS
 // ============================================================
 
+// Conversation messages kept in memory (older ones are dropped; readers
+// only ever look at the recent tail)
+const MAX_CONVERSATION_MESSAGES = 500
+
 export class Blackboard {
   private state: BlackboardState
   private subscribers: Map<string, Set<(state: BlackboardState) => void>>
@@ -202,6 +206,11 @@ export class Blackboard {
     this.state.messages.push(newMessage)
     this.state.orchestrator.conversationDepth++
     
+    // Keep only the recent tail (prevent unbounded growth on long sessions)
+    if (this.state.messages.length > MAX_CONVERSATION_MESSAGES) {
+      this.state.messages.splice(0, this.state.messages.length - MAX_CONVERSATION_MESSAGES)
+    }
+    
     // Log to temporal memory
     this.state.temporal.addEvent({
       verb: 'message_added',
@@ -227,6 +236,22 @@ export class Blackboard {
     return this.state.messages.slice(-count)
   }
   
+  /**
+   * Total messages added since creation/reset (unaffected by trimming)
+   */
+  getMessageCount(): number {
+    return this.state.orchestrator.conversationDepth
+  }
+  
+  /**
+   * Get messages added after the first `count` messages
+   * Pair with getMessageCount() to collect messages added during an operation
+   */
+  getMessagesSince(count: number): ConversationMessage[] {
+    const dropped = this.state.orchestrator.conversationDepth - this.state.messages.length
+    return this.state.messages.slice(Math.max(0, count - dropped))
+  }
+  
   getConversationContext(): string {
     const recent = this.getRecentMessages(5)
     return recent
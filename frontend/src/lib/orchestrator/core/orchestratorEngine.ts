@@ -42,6 +42,17 @@ import { DeleteNodeAction } from '../actions/navigation/DeleteNodeAction'
 import { OpenDocumentAction } from '../actions/navigation/OpenDocumentAction'
 import { NavigateSectionAction } from '../actions/navigation/NavigateSectionAction'
 
+/**
+ * Intents whose handling reads the RAG context: answer_question feeds it
+ * into the prompt, write_content counts it toward task complexity. For
+ * every other intent the semantic search result would be discarded, so
+ * the embedding + search round-trip is skipped.
+ */
+const RAG_INTENTS: ReadonlySet<UserIntent> = new Set<UserIntent>([
+  'answer_question',
+  'write_content'
+])
+
 // ============================================================
 // TYPES
 // ============================================================
@@ -298,12 +309,12 @@ export class OrchestratorEngine {
     })
     
     // Step 6: Enhance with RAG if enabled (AFTER intent analysis)
-    // SKIP RAG for structure generation - we'll handle it separately with summaries fallback
+    // Only for intents that read the result (see RAG_INTENTS) - structure
+    // generation handles it separately with summaries fallback
     let ragContext: any = null
     if (this.config.enableRAG && 
         canvasContext.connectedNodes.length > 0 &&
-        intentAnalysis.intent !== 'create_structure' &&
-        intentAnalysis.intent !== 'clarify_intent') {
+        RAG_INTENTS.has(intentAnalysis.intent)) {
       
       ragContext = await enhanceContextWithRAG(
         request.message,
@@ -663,14 +674,14 @@ export class OrchestratorEngine {
   
   private getAvailableProviders(request: OrchestratorRequest): string[] | undefined {
     if (this.worldState) {
-      return this.worldState.getState().user.availableProviders
+      return this.worldState.getAvailableProviders()
     }
     return request.availableProviders
   }
   
   private getAvailableModels(request: OrchestratorRequest): TieredModel[] | undefined {
     if (this.worldState) {
-      return this.worldState.getState().user.availableModels
+      return this.worldState.getAvailableModels()
     }
     return request.availableModels
   }
@@ -740,15 +751,17 @@ export class OrchestratorEngine {
     }
     
     // 🔍 DEBUG: Log final actions before returning
-    console.log('🔍 [generateActions] Returning actions:', {
-      count: actions.length,
-      types: actions.map(a => a.type),
-      details: actions.map(a => ({
-        type: a.type,
-        sectionId: a.payload?.sectionId,
-        sectionName: a.payload?.sectionName
-      }))
-    })
+    if (process.env.NODE_ENV === 'development') {
+      console.log('🔍 [generateActions] Returning actions:', {
+        count: actions.length,
+        types: actions.map(a => a.type),
+        details: actions.map(a => ({
+          type: a.type,
+          sectionId: a.payload?.sectionId,
+          sectionName: a.payload?.sectionName
+        }))
+      })
+    }
     
     return actions
   }
@@ -1301,14 +1314,16 @@ USE CONSISTENT ID FORMAT:
     const data = await response.json()
     
     // DEBUG: Log to console what we actually received
-    console.log('🔍 [Structure Generation] API Response:', {
-      keys: Object.keys(data),
-      fullData: data, // Show everything
-      hasContent: !!data.content,
-      hasStructuredOutput: !!data.structured_output,
-      contentType: typeof data.content,
-      contentPreview: typeof data.content === 'string' ? data.content.substring(0, 200) : data.content
-    })
+    if (process.env.NODE_ENV === 'development') {
+      console.log('🔍 [Structure Generation] API Response:', {
+        keys: Object.keys(data),
+        fullData: data, // Show everything
+        hasContent: !!data.content,
+        hasStructuredOutput: !!data.structured_output,
+        contentType: typeof data.content,
+        contentPreview: typeof data.content === 'string' ? data.content.substring(0, 200) : data.content
+      })
+    }
     
     let planData: any
     
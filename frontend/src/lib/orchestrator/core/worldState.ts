@@ -258,6 +258,20 @@ export class WorldStateManager {
     return this.state.user.preferences
   }
   
+  /**
+   * Get providers the user has API keys for
+   */
+  getAvailableProviders(): string[] {
+    return this.state.user.availableProviders
+  }
+  
+  /**
+   * Get models available to the user
+   */
+  getAvailableModels(): TieredModel[] {
+    return this.state.user.availableModels
+  }
+  
   /**
    * Check if document panel is open
    */
@@ -150,7 +150,9 @@ export class WriteContentTool extends BaseTool<WriteContentInput, WriteContentOu
       const contentMap = activeDoc.content ? Object.fromEntries(activeDoc.content) : {}
       
       // ✅ DEBUG: Log all available section IDs
-      console.log(`🔍 [WriteContentTool] Available section IDs in structure:`, structureItems.map(item => item.id))
+      if (process.env.NODE_ENV === 'development') {
+        console.log(`🔍 [WriteContentTool] Available section IDs in structure:`, structureItems.map(item => item.id))
+      }
       console.log(`🔍 [WriteContentTool] Looking for section ID: "${sectionId}"`)
       
       // ✅ CRITICAL: Find the structure item to get its summary
@@ -15,6 +15,7 @@ import {
   ProviderError,
 } from './types'
 import { NormalizedModel } from '@/types/api-keys'
+import { BoundedCache } from '@/lib/boundedCache'
 
 // Static pricing data for OpenAI models (as of Nov 2024)
 // Reference: https://openai.com/api/pricing/
@@ -133,9 +134,19 @@ const OPENAI_CONTEXT_WINDOWS: Record<string, number> = {
   'gpt-3.5-turbo-0125': 16385,
 }
 
+// Max cached clients (one per distinct user API key)
+const OPENAI_CLIENT_CACHE_MAX_ENTRIES = 50
+
 export class OpenAIAdapter implements LLMProviderAdapter {
   readonly name = 'OpenAI'
 
+  /**
+   * Clients keyed by API key, so repeated calls (e.g. writer → critic →
+   * revision) reuse one client and its keep-alive connections instead of
+   * constructing a new one per request. Bounded as an LRU.
+   */
+  private clients = new BoundedCache<string, OpenAI>(OPENAI_CLIENT_CACHE_MAX_ENTRIES)
+
   /**
    * Create OpenAI client instance
    */
@@ -143,12 +154,25 @@ export class OpenAIAdapter implements LLMProviderAdapter {
     return new OpenAI({ apiKey })
   }
 
+  /**
+   * Get the cached client for an API key (creating it on first use)
+   */
+  private getClient(apiKey: string): OpenAI {
+    let client = this.clients.get(apiKey)
+    if (!client) {
+      client = this.createClient(apiKey)
+      this.clients.set(apiKey, client)
+    }
+
+    return client
+  }
+
   /**
    * Fetch all available models from OpenAI API
    */
   async fetchModels(apiKey: string): Promise<NormalizedModel[]> {
     try {
-      const client = this.createClient(apiKey)
+      const client = this.getClient(apiKey)
       const response = await client.models.list()
 
       console.log('[OpenAI] Raw models from API:', response.data.map(m => m.id).join(', '))
@@ -207,7 +231,7 @@ export class OpenAIAdapter implements LLMProviderAdapter {
    */
   async generate(apiKey: string, params: GenerateParams): Promise<ProviderGenerateResponse> {
     try {
-      const client = this.createClient(apiKey)
+      const client = this.getClient(apiKey)
 
       // Detect if this is a reasoning model (GPT-5, o1)
       const isReasoningModel = params.model.toLowerCase().includes('gpt-5') || 
@@ -320,7 +344,7 @@ export class OpenAIAdapter implements LLMProviderAdapter {
    */
   async *generateStream(apiKey: string, params: GenerateParams) {
     try {
-      const client = this.createClient(apiKey)
+      const client = this.getClient(apiKey)
 
       // Check if this is a reasoning model (o1, gpt-5, etc.)
       const isReasoningModel = params.model.toLowerCase().includes('gpt-5') || 
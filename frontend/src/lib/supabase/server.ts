@@ -1,5 +1,5 @@
 import { createServerClient, type CookieOptions } from '@supabase/ssr'
-import { createClient as createSupabaseClient } from '@supabase/supabase-js'
+import { createClient as createSupabaseClient, type SupabaseClient } from '@supabase/supabase-js'
 import { cookies } from 'next/headers'
 
 export async function createClient() {
@@ -64,6 +64,8 @@ export async function createClient() {
   )
 }
 
+let adminClient: SupabaseClient | null = null
+
 /**
  * Create a Supabase admin client using SERVICE_ROLE key
  * 
@@ -75,6 +77,12 @@ export async function createClient() {
  * - Admin operations
  */
 export function createAdminClient() {
+  // Service role clients carry no per-request auth state, so a single
+  // instance is shared across requests (reuses its HTTP connections)
+  if (adminClient) {
+    return adminClient
+  }
+  
   const url = process.env.NEXT_PUBLIC_SUPABASE_URL
   const serviceRoleKey = process.env.SUPABASE_SERVICE_ROLE_KEY
   
@@ -85,11 +93,13 @@ export function createAdminClient() {
     )
   }
   
-  return createSupabaseClient(url, serviceRoleKey, {
+  adminClient = createSupabaseClient(url, serviceRoleKey, {
     auth: {
       autoRefreshToken: false,
       persistSession: false
     }
   })
+  
+  return adminClient
 }
 
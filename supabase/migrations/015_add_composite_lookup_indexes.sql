@@ -0,0 +1,19 @@
+-- Composite indexes for the "latest row per user" lookups
+-- The existing single-column indexes let Postgres find a user's rows, but
+-- the ORDER BY ... LIMIT queries still sort them. Leading with user_id and
+-- trailing with the sort column turns these into a single index range scan.
+
+-- Last sync lookup (GET /api/models/sync):
+--   WHERE user_id = $1 ORDER BY synced_at DESC LIMIT 1
+CREATE INDEX IF NOT EXISTS idx_model_sync_history_user_synced
+  ON public.model_sync_history(user_id, synced_at DESC);
+
+-- Active keys listing (/api/models, /api/models/available):
+--   WHERE user_id = $1 AND is_active = true ORDER BY created_at DESC
+-- Partial index keeps inactive (revoked/rotated) keys out of it entirely
+CREATE INDEX IF NOT EXISTS idx_user_api_keys_active_created
+  ON public.user_api_keys(user_id, created_at DESC)
+  WHERE is_active = true;
+
+-- Superseded by idx_model_sync_history_user_synced (same leading column)
+DROP INDEX IF EXISTS public.idx_model_sync_history_user_id;